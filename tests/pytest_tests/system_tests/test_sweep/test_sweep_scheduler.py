@@ -823,3 +823,37 @@ def test_launch_sweep_scheduler_macro_args(user, monkeypatch, command):
     scheduler._register_agents()
     srun2 = scheduler._get_next_sweep_run(0)
     scheduler._add_to_launch_queue(srun2)
+
+
+def test_launch_sweep_scheduler_reuses_public_api(user, monkeypatch):
+    monkeypatch.setattr(
+        "wandb.sdk.launch.sweeps.scheduler.Scheduler._init_wandb_run",
+        lambda _x: Mock(["finish", "config", "id"]),
+    )
+
+    launch_add_calls = []
+
+    def mock_launch_add(*args, **kwargs):
+        launch_add_calls.append((args, kwargs))
+        return Mock(spec=public.QueuedRun)
+
+    monkeypatch.setattr(
+        "wandb.sdk.launch.launch_add._launch_add",
+        mock_launch_add,
+    )
+
+    api = internal.Api()
+    sweep_id = wandb.sweep(VALID_SWEEP_CONFIGS_MINIMAL[0], entity=user, project="t")
+    scheduler = SweepScheduler(
+        api, sweep_id=sweep_id, entity=user, project="t", job="job:latest"
+    )
+    for run_id in ["run-1", "run-2"]:
+        scheduler._add_to_launch_queue(
+            SweepRun(id=run_id, worker_id=0, args={"foo": {"value": 1}})
+        )
+
+    assert len(launch_add_calls) == 2
+    for args, kwargs in launch_add_calls:
+        assert args[0] is scheduler._api
+        assert kwargs["public_api"] is scheduler._public_api
+
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import pytest
+from wandb.sdk.launch import launch_add
+
+
+@pytest.fixture
+def enqueue(monkeypatch):
+    launch_spec = {"entity": "e", "project": "p", "job": "e/p/job:latest"}
+    monkeypatch.setattr(
+        launch_add, "construct_launch_spec", lambda *args: dict(launch_spec)
+    )
+    monkeypatch.setattr(launch_add, "validate_launch_spec_source", lambda spec: None)
+    monkeypatch.setattr(
+        launch_add,
+        "push_to_queue",
+        lambda *args: {"runQueueItemId": "rqi", "runSpec": None},
+    )
+    termlog = MagicMock()
+    monkeypatch.setattr("wandb.termlog", termlog)
+
+    def _enqueue():
+        launch_add._launch_add(
+            MagicMock(),
+            None,
+            "e/p/job:latest",
+            None,
+            "p",
+            "e",
+            "q",
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            public_api=MagicMock(),
+        )
+        return [call.args[0] for call in termlog.call_args_list]
+
+    return _enqueue
+
+
+def test_launch_spec_not_printed_by_default(enqueue, monkeypatch):
+    monkeypatch.delenv("WANDB_LAUNCH_VERBOSE", raising=False)
+    logs = enqueue()
+    assert any("Added run to queue q" in log for log in logs)
+    assert not any("Launch spec" in log for log in logs)
+
+
+@pytest.mark.parametrize("value", ["1", "true", "True"])
+def test_launch_spec_printed_when_verbose(enqueue, monkeypatch, value):
+    monkeypatch.setenv("WANDB_LAUNCH_VERBOSE", value)
+    logs = enqueue()
+    assert any("Launch spec" in log and "e/p/job:latest" in log for log in logs)
+
+
+@pytest.mark.parametrize("value", ["0", "false", ""])
+def test_launch_spec_not_printed_when_verbose_disabled(enqueue, monkeypatch, value):
+    monkeypatch.setenv("WANDB_LAUNCH_VERBOSE", value)
+    logs = enqueue()
+    assert not any("Launch spec" in log for log in logs)
@@ -0,0 +1,222 @@
+import itertools
+from typing import Callable, List, Optional
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from wandb.apis import internal, public
+from wandb.sdk.launch.sweeps import SchedulerError
+from wandb.sdk.launch.sweeps.scheduler import MAX_REGISTER_THREADS, SchedulerState
+from wandb.sdk.launch.sweeps.scheduler_sweep import SweepScheduler
+
+POLLING_SLEEP = 5.0
+
+
+class FakeClock:
+    """Stands in for the `time` module used by the scheduler loop."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+        self.on_sleep: Optional[Callable[[], None]] = None
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        if self.on_sleep:
+            self.on_sleep()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("wandb.sdk.launch.sweeps.scheduler.time", clock)
+    return clock
+
+
+@pytest.fixture
+def make_scheduler(monkeypatch):
+    monkeypatch.setattr("wandb.sdk.launch.sweeps.scheduler.PublicApi", MagicMock())
+    monkeypatch.setattr(
+        "wandb.sdk.launch.sweeps.scheduler.Scheduler._init_wandb_run",
+        lambda _x: MagicMock(config={}),
+    )
+    monkeypatch.setattr(
+        "wandb.sdk.launch.launch_add._launch_add",
+        MagicMock(return_value=Mock(spec=public.QueuedRun)),
+    )
+    monkeypatch.setattr("wandb.termlog", MagicMock())
+
+    def _make(api, num_workers=1, register=True):
+        scheduler = SweepScheduler(
+            api,
+            sweep_id="sweep",
+            entity="e",
+            project="p",
+            polling_sleep=POLLING_SLEEP,
+            num_workers=num_workers,
+        )
+        if register:
+            scheduler._register_agents()
+        return scheduler
+
+    return _make
+
+
+def _mock_api(run_cap=None):
+    sweep_config = (
+        "job: job:latest\nmethod: grid\nparameters: {foo: {values: [1, 2]}}\n"
+    )
+    if run_cap:
+        sweep_config += f"run_cap: {run_cap}\n"
+    api = MagicMock()
+    api.sweep.return_value = {"config": sweep_config, "runs": []}
+    api.register_agent.side_effect = lambda host, **_: {"id": host}
+    api.get_run_state.return_value = "running"
+    api.get_sweep_state.return_value = "RUNNING"
+    return api
+
+
+def _run_command(run_id):
+    return [{"type": "run", "run_id": run_id, "args": {"foo": {"value": 1}}}]
+
+
+def test_run_launches_on_every_free_worker_then_sleeps(make_scheduler, clock):
+    api = _mock_api()
+    api.get_sweep_state.side_effect = ["RUNNING", "FINISHED"]
+    api.agent_heartbeat.side_effect = [_run_command(f"r{i}") for i in range(3)]
+    scheduler = make_scheduler(api, num_workers=3)
+
+    scheduler.run()
+
+    assert api.agent_heartbeat.call_count == 3
+    assert sorted(scheduler._runs) == ["r0", "r1", "r2"]
+    assert sorted(r.worker_id for r in scheduler._runs.values()) == [0, 1, 2]
+    # one pass fills every free worker, the loop then waits the usual interval
+    assert clock.sleeps == [POLLING_SLEEP]
+    assert api.get_sweep_state.call_count == 2
+
+
+def test_run_keeps_sleeping_when_paused_after_stop(make_scheduler, clock):
+    api = _mock_api()
+    # a stop command, then the sweep is paused while a run is still active
+    api.get_sweep_state.side_effect = itertools.chain(
+        ["RUNNING"], itertools.repeat("PAUSED")
+    )
+    api.agent_heartbeat.side_effect = [_run_command("r0"), [{"type": "stop"}]]
+    scheduler = make_scheduler(api, num_workers=2)
+
+    def finish_runs():
+        if clock.now >= 6 * POLLING_SLEEP:
+            api.get_run_state.return_value = "finished"
+
+    clock.on_sleep = finish_runs
+    scheduler.run()
+
+    assert scheduler.state == SchedulerState.FLUSH_RUNS
+    assert scheduler.num_active_runs == 0
+    assert clock.sleeps == [POLLING_SLEEP] * 6
+    assert api.get_sweep_state.call_count == 7
+
+
+def test_run_backs_off_heartbeat_while_idle(make_scheduler, clock):
+    api = _mock_api()
+    commands = iter([[], [], [], _run_command("r0")])
+    heartbeats = []
+
+    def agent_heartbeat(agent_id, **_):
+        heartbeats.append((clock.now, agent_id))
+        return next(commands, [])
+
+    api.agent_heartbeat.side_effect = agent_heartbeat
+    scheduler = make_scheduler(api, num_workers=2)
+    w0, w1 = (scheduler._workers[i].agent_id for i in (0, 1))
+
+    def finish_sweep():
+        if clock.now >= 55:
+            api.get_sweep_state.return_value = "FINISHED"
+
+    clock.on_sleep = finish_sweep
+    scheduler.run()
+
+    assert heartbeats == [
+        # idle, heartbeats back off while the loop keeps its polling sleep
+        (0, w0),
+        (5, w0),
+        (15, w0),
+        # a launched run resets the backoff, the next idle worker starts over
+        (35, w0),
+        (35, w1),
+        (40, w1),
+        (50, w1),
+    ]
+    assert clock.sleeps == [POLLING_SLEEP] * 11
+
+
+def test_run_checks_run_cap_while_backing_off(make_scheduler, clock):
+    api = _mock_api(run_cap=1)
+    scheduler = make_scheduler(api)
+    scheduler._num_runs_launched = 1
+    scheduler._next_heartbeat_at = 100.0
+
+    scheduler.run()
+
+    # flushes after the first pass instead of waiting out the backoff
+    assert clock.sleeps == [POLLING_SLEEP]
+    assert api.agent_heartbeat.call_count == 0
+    assert scheduler.state == SchedulerState.COMPLETED
+
+
+def test_register_agents_maps_every_worker(make_scheduler):
+    api = _mock_api()
+    scheduler = make_scheduler(api, num_workers=20, register=False)
+
+    scheduler._register_agents()
+
+    assert api.register_agent.call_count == 20
+    assert sorted(scheduler._workers) == list(range(20))
+    for worker_id, worker in scheduler._workers.items():
+        assert worker.agent_id.endswith(f"-{worker_id}")
+        assert worker.agent_config == {"id": worker.agent_id}
+
+
+def test_register_agents_uses_an_api_per_thread(make_scheduler, monkeypatch):
+    internal_apis = []
+
+    def make_internal_api(*args, **kwargs):
+        internal_apis.append(_mock_api())
+        return internal_apis[-1]
+
+    monkeypatch.setattr("wandb.apis.internal.InternalApi", make_internal_api)
+    api = internal.Api()
+    scheduler = make_scheduler(api, num_workers=20, register=False)
+    assert internal_apis == [api.api]
+
+    scheduler._register_agents()
+
+    assert sorted(scheduler._workers) == list(range(20))
+    # registration never goes through the scheduler's own (shared) Api
+    assert api.api.register_agent.call_count == 0
+    thread_apis = internal_apis[1:]
+    assert 1 <= len(thread_apis) <= MAX_REGISTER_THREADS
+    assert sum(a.register_agent.call_count for a in thread_apis) == 20
+
+
+def test_register_agents_fails_sweep_on_error(make_scheduler):
+    api = _mock_api()
+
+    def register_agent(host, **_):
+        if host.endswith("-3"):
+            raise Exception("bad worker")
+        return {"id": host}
+
+    api.register_agent.side_effect = register_agent
+    scheduler = make_scheduler(api, num_workers=5, register=False)
+
+    with pytest.raises(SchedulerError, match="bad worker"):
+        scheduler._register_agents()
+
+    assert scheduler.state == SchedulerState.FAILED
+    assert scheduler._workers == {}
@@ -4,11 +4,12 @@ import asyncio
 import dataclasses
 import datetime
 import sys
-from typing import Iterator
+from typing import Callable, Iterator
 from unittest import mock
 
 import pytest
 from wandb.sdk.lib import retry
+from wandb.sdk.lib.mailbox import ContextCancelledError
 
 if sys.version_info >= (3, 10):
     asyncio_run = asyncio.run
@@ -20,34 +21,46 @@ else:
 
 @dataclasses.dataclass
 class MockTime:
-    now: datetime.datetime
-    sleep: mock.Mock
+    now: Callable[[], datetime.datetime]
+    sleep: Callable[[float], None]
     sleep_async: mock.Mock
 
 
 @pytest.fixture(autouse=True)
 def mock_time() -> Iterator[MockTime]:
     """Mock out the now()/sleep() funcs used by the retry logic."""
-    now = datetime.datetime.now()
+    # track elapsed time as float seconds and only rebuild the datetime when a
+    # sleep advances it, the retry logic asks for the time more often than it sleeps
+    start = now = datetime.datetime.now()
+    elapsed = 0.0
+
+    def _now():
+        return now
 
     def _sleep(seconds):
-        nonlocal now
-        now += datetime.timedelta(seconds=seconds)
+        nonlocal elapsed, now
+        elapsed += seconds
+        now = start + datetime.timedelta(seconds=elapsed)
 
     async def _sleep_async(seconds):
-        nonlocal now
-        now += datetime.timedelta(seconds=seconds)
+        _sleep(seconds)
         await asyncio.sleep(1e-9)  # let the event loop shuffle stuff around
 
-    with mock.patch(
-        "wandb.sdk.lib.retry.NOW_FN",
-        wraps=lambda: now,
-    ) as mock_now, mock.patch(
-        "wandb.sdk.lib.retry.SLEEP_FN", side_effect=_sleep
-    ) as mock_sleep, mock.patch(
+    # now()/sleep() are plain functions rather than mocks since no test asserts
+    # on their calls, and the retry loops call them many times
+    with mock.patch("wandb.sdk.lib.retry.NOW_FN", _now), mock.patch(
+        "wandb.sdk.lib.retry.SLEEP_FN", _sleep
+    ), mock.patch(
         "wandb.sdk.lib.retry.SLEEP_ASYNC_FN", side_effect=_sleep_async
     ) as mock_sleep_async:
-        yield MockTime(now=mock_now, sleep=mock_sleep, sleep_async=mock_sleep_async)
+        yield MockTime(now=_now, sleep=_sleep, sleep_async=mock_sleep_async)
+
+
+def _exhaust(retrier, num_calls: int) -> None:
+    """Call `retrier` `num_calls` times, expecting each call to give up."""
+    for _ in range(num_calls):
+        with pytest.raises(ValueError):
+            retrier()
 
 
 def test_retry_respects_num_retries():
@@ -91,10 +104,7 @@ def test_retry_respects_num_retries_across_multiple_calls():
         num_retries=num_retries,
         retryable_exceptions=(ValueError,),
     )
-    with pytest.raises(ValueError):
-        retrier()
-    with pytest.raises(ValueError):
-        retrier()
+    _exhaust(retrier, 2)
 
     assert func.call_count == 2 * (num_retries + 1)
 
@@ -146,8 +156,8 @@ def test_retry_respects_secondary_timeout(mock_time: MockTime):
     with pytest.raises(ValueError):
         retrier()
 
-    # add some slop for other timeout calls, should be about 10 minutes of retries
-    assert 10 <= (mock_time.now() - t0).total_seconds() / 60 < 20
+    # the final attempt happens at the deadline, so about 10 minutes of retries
+    assert 10 <= (mock_time.now() - t0).total_seconds() / 60 < 11
 
 
 class MyError(Exception):
@@ -199,7 +209,7 @@ class TestExponentialBackoff:
         t0 = mock_time.now()
         dt = 300 * SECOND
         backoff = retry.ExponentialBackoff(
-            initial_sleep=SECOND, max_sleep=10 * dt, timeout_at=t0 + dt
+            initial_sleep=SECOND, max_sleep=10 * dt, timeout_at=t0 + dt, seed=0
         )
         with pytest.raises(MyError):
             for _ in range(9999):
@@ -207,7 +217,19 @@ class TestExponentialBackoff:
                     backoff.next_sleep_or_reraise(MyError()).total_seconds()
                 )
 
-        assert t0 + dt <= mock_time.now() <= t0 + 2 * dt
+        assert t0 + dt <= mock_time.now() < t0 + dt + SECOND
+
+    def test_jitter_is_deterministic_when_seeded(self):
+        def sleeps(seed):
+            backoff = retry.ExponentialBackoff(
+                initial_sleep=SECOND, max_sleep=100 * SECOND, seed=seed
+            )
+            return [backoff.next_sleep_or_reraise(MyError()) for _ in range(10)]
+
+        assert sleeps(1) == sleeps(1)
+        assert sleeps(1) != sleeps(2)
+        assert sleeps(1)[0] != sleeps(2)[0]
+        assert all(SECOND <= s <= 100 * SECOND for s in sleeps(1))
 
     def test_respects_max_sleep_if_smaller_than_initial_sleep(
         self, mock_time: MockTime
@@ -285,3 +307,27 @@ class TestRetryAsync:
                 mock.call(excs[1]),
             ]
         )
+
+    def test_stops_sleeping_when_cancelled(self):
+        backoff = mock.Mock(
+            spec=retry.Backoff,
+            next_sleep_or_reraise=mock.Mock(return_value=1000 * SECOND),
+        )
+        fn = mock.Mock(side_effect=MyError("oh no"))
+
+        async def fn_async():
+            return fn()
+
+        async def run():
+            cancel_event = asyncio.Event()
+            task = asyncio.ensure_future(
+                retry.retry_async(backoff, fn_async, cancel_event=cancel_event)
+            )
+            await asyncio.sleep(0)
+            cancel_event.set()
+            await asyncio.wait_for(task, timeout=5)
+
+        with pytest.raises(ContextCancelledError):
+            asyncio_run(run())
+
+        fn.assert_called_once()
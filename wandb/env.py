@@ -81,6 +81,7 @@ SENTRY_DSN = "WANDB_SENTRY_DSN"
 INIT_TIMEOUT = "WANDB_INIT_TIMEOUT"
 GIT_COMMIT = "WANDB_GIT_COMMIT"
 GIT_REMOTE_URL = "WANDB_GIT_REMOTE_URL"
+LAUNCH_VERBOSE = "WANDB_LAUNCH_VERBOSE"
 _EXECUTABLE = "WANDB_EXECUTABLE"
 
 # For testing, to be removed in future version
@@ -152,6 +153,10 @@ def ssl_disabled() -> bool:
     return _env_as_bool(DISABLE_SSL, default="False")
 
 
+def launch_verbose() -> bool:
+    return _env_as_bool(LAUNCH_VERBOSE, default="False")
+
+
 def get_error_reporting(
     default: Union[bool, str] = True,
     env: Optional[Env] = None,
@@ -1,8 +1,10 @@
+import logging
 import pprint
 from typing import Any, Dict, List, Optional
 
 import wandb
 import wandb.apis.public as public
+from wandb import env
 from wandb.apis.internal import Api
 from wandb.sdk.launch._project_spec import create_project_from_spec
 from wandb.sdk.launch.builder.build import build_image_from_project
@@ -14,6 +16,8 @@ from wandb.sdk.launch.utils import (
     validate_launch_spec_source,
 )
 
+_logger = logging.getLogger(__name__)
+
 
 def push_to_queue(
     api: Api, queue_name: str, launch_spec: Dict[str, Any], project_queue: str
@@ -137,6 +141,7 @@ def _launch_add(
     repository: Optional[str] = None,
     sweep_id: Optional[str] = None,
     author: Optional[str] = None,
+    public_api: Optional[public.Api] = None,
 ) -> "public.QueuedRun":
     launch_spec = construct_launch_spec(
         uri,
@@ -157,6 +162,9 @@ def _launch_add(
         sweep_id,
     )
 
+    # whether the job runs from a docker image, resolved lazily below since
+    # it requires fetching the job artifact
+    container_job: Optional[bool] = None
     if build:
         if resource == "local-process":
             raise LaunchError(
@@ -183,6 +191,8 @@ def _launch_add(
         job = f"{launch_spec['entity']}/{launch_spec['project']}/{job_name}"
         launch_spec["job"] = job
         launch_spec["uri"] = None  # Remove given URI --> now in job
+        # the job was just built from a docker image, no need to fetch it
+        container_job = True
 
     if queue_name is None:
         queue_name = "default"
@@ -206,13 +216,20 @@ def _launch_add(
         wandb.termlog(f"{LOG_PREFIX}Added run to queue {queue_name}.")
     else:
         wandb.termlog(f"{LOG_PREFIX}Added run to queue {project_queue}/{queue_name}.")
-    wandb.termlog(f"{LOG_PREFIX}Launch spec:\n{pprint.pformat(launch_spec)}\n")
-    public_api = public.Api()
-    container_job = False
-    if job:
-        job_artifact = public_api.job(job)
-        if job_artifact._job_info.get("source_type") == "image":
-            container_job = True
+    # pretty-printing large specs is slow, only do it when asked to
+    if env.launch_verbose():
+        wandb.termlog(f"{LOG_PREFIX}Launch spec:\n{pprint.pformat(launch_spec)}\n")
+    else:
+        _logger.debug("Launch spec: %s", launch_spec)
+    # callers enqueuing many runs can pass in a public api to reuse
+    if public_api is None:
+        public_api = public.Api()
+    if container_job is None:
+        container_job = False
+        if job:
+            job_artifact = public_api.job(job)
+            if job_artifact._job_info.get("source_type") == "image":
+                container_job = True
 
     queued_run = public_api.queued_run(
         launch_spec["entity"],
@@ -1,5 +1,6 @@
 """Abstract Scheduler class."""
 import base64
+import copy
 import logging
 import os
 import socket
@@ -7,6 +8,7 @@ import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
@@ -20,8 +22,8 @@ from wandb.apis.internal import Api
 from wandb.apis.public import Api as PublicApi
 from wandb.apis.public import QueuedRun, Run
 from wandb.errors import CommError
+from wandb.sdk.launch import launch_add
 from wandb.sdk.launch.errors import LaunchError
-from wandb.sdk.launch.launch_add import launch_add
 from wandb.sdk.launch.sweeps import SchedulerError
 from wandb.sdk.launch.sweeps.utils import (
     create_sweep_command_args,
@@ -34,6 +36,8 @@ _logger = logging.getLogger(__name__)
 LOG_PREFIX = f"{click.style('sched:', fg='cyan')} "
 
 DEFAULT_POLLING_SLEEP = 5.0
+MAX_HEARTBEAT_BACKOFF = 30.0
+MAX_REGISTER_THREADS = 8
 
 
 class SchedulerState(Enum):
@@ -148,6 +152,10 @@ class Scheduler(ABC):
         # Threading lock to ensure thread-safe access to the runs dictionary
         self._threading_lock: threading.Lock = threading.Lock()
         self._polling_sleep = polling_sleep or DEFAULT_POLLING_SLEEP
+        # Back off asking for new runs while the backend has none for us,
+        # without slowing down the rest of the polling loop
+        self._heartbeat_backoff = 0.0
+        self._next_heartbeat_at = 0.0
         self._project_queue = project_queue
         # Optionally run multiple workers in (pseudo-)parallel. Workers do not
         # actually run training workloads, they simply send heartbeat messages
@@ -230,19 +238,18 @@ class Scheduler(ABC):
         runs should always have a worker_id, but are created before
         workers are assigned to the run
         """
-        busy_workers = {}
-        for _, r in self._yield_runs():
-            busy_workers[r.worker_id] = self._workers[r.worker_id]
-        return busy_workers
+        with self._threading_lock:
+            return {
+                r.worker_id: self._workers[r.worker_id] for r in self._runs.values()
+            }
 
     @property
     def available_workers(self) -> Dict[int, _Worker]:
         """Returns dict of id:worker ready to launch another run."""
         if len(self._workers) == 0:
             return {}
-        return {
-            _id: w for _id, w in self._workers.items() if _id not in self.busy_workers
-        }
+        busy_workers = self.busy_workers
+        return {_id: w for _id, w in self._workers.items() if _id not in busy_workers}
 
     def _init_wandb_run(self) -> SdkRun:
         """Controls resume or init logic for a scheduler wandb run."""
@@ -310,30 +317,7 @@ class Scheduler(ABC):
                     time.sleep(self._polling_sleep)
                     continue
 
-                for worker_id in self.available_workers:
-                    if self.at_runcap:
-                        wandb.termlog(
-                            f"{LOG_PREFIX}Sweep at run_cap ({self._num_runs_launched})"
-                        )
-                        self.state = SchedulerState.FLUSH_RUNS
-                        break
-
-                    try:
-                        run: Optional[SweepRun] = self._get_next_sweep_run(worker_id)
-                        if not run:
-                            break
-                    except SchedulerError as e:
-                        raise SchedulerError(e)
-                    except Exception as e:
-                        wandb.termerror(
-                            f"{LOG_PREFIX}Failed to get next sweep run: {e}"
-                        )
-                        self.state = SchedulerState.FAILED
-                        break
-
-                    if self._add_to_launch_queue(run):
-                        self._num_runs_launched += 1
-
+                self._launch_runs()
                 time.sleep(self._polling_sleep)
         except KeyboardInterrupt:
             wandb.termwarn(f"{LOG_PREFIX}Scheduler received KeyboardInterrupt. Exiting")
@@ -351,6 +335,55 @@ class Scheduler(ABC):
                 self.state = SchedulerState.COMPLETED
             self.exit()
 
+    def _launch_runs(self) -> None:
+        """Try to launch a run on each available worker.
+
+        Launching a run resets the heartbeat backoff, getting no run back from
+        the backend increases it.
+        """
+        for worker_id in self.available_workers:
+            if self.at_runcap:
+                wandb.termlog(
+                    f"{LOG_PREFIX}Sweep at run_cap ({self._num_runs_launched})"
+                )
+                self.state = SchedulerState.FLUSH_RUNS
+                break
+
+            if time.monotonic() < self._next_heartbeat_at:
+                # backing off, the backend had no runs for us recently
+                break
+
+            try:
+                run: Optional[SweepRun] = self._get_next_sweep_run(worker_id)
+                if not run:
+                    self._increase_heartbeat_backoff()
+                    break
+            except SchedulerError as e:
+                raise SchedulerError(e)
+            except Exception as e:
+                wandb.termerror(f"{LOG_PREFIX}Failed to get next sweep run: {e}")
+                self.state = SchedulerState.FAILED
+                break
+
+            if self._add_to_launch_queue(run):
+                self._num_runs_launched += 1
+                self._reset_heartbeat_backoff()
+
+    def _reset_heartbeat_backoff(self) -> None:
+        self._heartbeat_backoff = 0.0
+        self._next_heartbeat_at = 0.0
+
+    def _increase_heartbeat_backoff(self) -> None:
+        """Wait exponentially longer before asking for new runs again.
+
+        Starts at the polling sleep and doubles up to MAX_HEARTBEAT_BACKOFF.
+        """
+        self._heartbeat_backoff = min(
+            max(self._heartbeat_backoff * 2, self._polling_sleep),
+            max(MAX_HEARTBEAT_BACKOFF, self._polling_sleep),
+        )
+        self._next_heartbeat_at = time.monotonic() + self._heartbeat_backoff
+
     def exit(self) -> None:
         self._exit()
         # _save_state isn't controlled, possibly fails
@@ -419,23 +452,37 @@ class Scheduler(ABC):
             return False
 
     def _register_agents(self) -> None:
-        for worker_id in range(self._num_workers):
-            _logger.debug(f"{LOG_PREFIX}Starting AgentHeartbeat worker ({worker_id})")
-            try:
-                agent_config = self._api.register_agent(
-                    f"{socket.gethostname()}-{worker_id}",  # host
-                    sweep_id=self._sweep_id,
-                    project_name=self._project,
-                    entity=self._entity,
-                )
-            except Exception as e:
-                _logger.debug(f"failed to register agent: {e}")
-                self.fail_sweep(f"failed to register agent: {e}")
+        """Register all workers concurrently, each is a blocking network call.
 
-            self._workers[worker_id] = _Worker(
-                agent_config=agent_config,
-                agent_id=agent_config["id"],
+        The internal Api shares one GQL client and Retry between callers, which
+        is not thread-safe, so each registration thread works on its own copy.
+        """
+        local = threading.local()
+
+        def _register_agent(worker_id: int) -> _Worker:
+            api = getattr(local, "api", None)
+            if api is None:
+                api = local.api = (
+                    copy.copy(self._api) if isinstance(self._api, Api) else self._api
+                )
+            _logger.debug(f"{LOG_PREFIX}Starting AgentHeartbeat worker ({worker_id})")
+            agent_config = api.register_agent(
+                f"{socket.gethostname()}-{worker_id}",  # host
+                sweep_id=self._sweep_id,
+                project_name=self._project,
+                entity=self._entity,
             )
+            return _Worker(agent_config=agent_config, agent_id=agent_config["id"])
+
+        worker_ids = range(self._num_workers)
+        max_workers = max(min(self._num_workers, MAX_REGISTER_THREADS), 1)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                workers = list(pool.map(_register_agent, worker_ids))
+            self._workers.update(zip(worker_ids, workers))
+        except Exception as e:
+            _logger.debug(f"failed to register agent: {e}")
+            self.fail_sweep(f"failed to register agent: {e}")
 
     def _yield_runs(self) -> Iterator[Tuple[str, SweepRun]]:
         """Thread-safe way to iterate over the runs."""
@@ -454,9 +501,8 @@ class Scheduler(ABC):
                 del self._runs[run_id]
 
     def _stop_runs(self) -> None:
-        to_delete = []
-        for run_id, _ in self._yield_runs():
-            to_delete += [run_id]
+        with self._threading_lock:
+            to_delete = list(self._runs)
 
         for run_id in to_delete:
             wandb.termlog(f"{LOG_PREFIX}Stopping run ({run_id})")
@@ -685,20 +731,26 @@ class Scheduler(ABC):
         _job_launch_config = self._wandb_run.config.get("launch") or {}
 
         run_id = run.id or generate_id()
-        queued_run = launch_add(
+        # reuse the scheduler's api clients rather than creating new ones per run
+        queued_run = launch_add._launch_add(
+            self._api,
+            None,  # uri
+            _job,
+            launch_config,
+            self._project,
+            self._entity,
+            self._kwargs.get("queue"),
+            _job_launch_config.get("resource"),
+            entry_point,
+            None,  # name
+            None,  # version
+            _image_uri,  # TODO(gst): make agnostic (github? run uri?)
+            self._project_queue,
+            _job_launch_config.get("resource_args"),
             run_id=run_id,
-            entry_point=entry_point,
-            config=launch_config,
-            docker_image=_image_uri,  # TODO(gst): make agnostic (github? run uri?)
-            job=_job,
-            project=self._project,
-            entity=self._entity,
-            queue_name=self._kwargs.get("queue"),
-            project_queue=self._project_queue,
-            resource=_job_launch_config.get("resource"),
-            resource_args=_job_launch_config.get("resource_args"),
             author=self._kwargs.get("author"),
             sweep_id=self._sweep_id,
+            public_api=self._public_api,
         )
         run.queued_run = queued_run
         # TODO(gst): unify run and queued_run state
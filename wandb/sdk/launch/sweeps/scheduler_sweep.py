@@ -59,20 +59,24 @@ class SweepScheduler(Scheduler):
 
     def _get_sweep_commands(self, worker_id: int) -> List[Dict[str, Any]]:
         """Helper to recieve sweep command from backend."""
-        # AgentHeartbeat wants a Dict of runs which are running or queued
-        _run_states: Dict[str, bool] = {}
-        for run_id, run in self._yield_runs():
-            # Filter out runs that are from a different worker thread
-            if run.worker_id == worker_id and run.state.is_alive:
-                _run_states[run_id] = True
-
-        _logger.debug(f"Sending states: \n{pf(_run_states)}\n")
+        # AgentHeartbeat wants a Dict of runs which are running or queued,
+        # filtering out runs that are from a different worker thread
+        _run_states: Dict[str, bool] = {
+            run_id: True
+            for run_id, run in self._yield_runs()
+            if run.worker_id == worker_id and run.state.is_alive
+        }
+        agent_id = self._workers[worker_id].agent_id
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(f"Sending states: \n{pf(_run_states)}\n")
         commands: List[Dict[str, Any]] = self._api.agent_heartbeat(
-            agent_id=self._workers[worker_id].agent_id,
+            agent_id=agent_id,
             metrics={},
             run_states=_run_states,
         )
-        _logger.debug(f"AgentHeartbeat commands: \n{pf(commands)}\n")
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(f"AgentHeartbeat commands: \n{pf(commands)}\n")
 
         return commands
 
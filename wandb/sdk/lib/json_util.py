@@ -60,11 +60,12 @@ try:
 
         def load(fp: Any) -> Any:
             """Wrapper for orjson.load."""
+            content = fp.read()
             try:
-                decoded = orjson.loads(fp.read())
+                decoded = orjson.loads(content)
             except Exception as e:
                 logger.exception(f"Error using orjson.load: {e}")
-                decoded = json.load(fp)
+                decoded = json.loads(content)
 
             return decoded
 
@@ -119,8 +119,13 @@ class Retry(Generic[_R]):
             "check_retry_fn", self._check_retry_fn
         )
 
+        # bind hot-loop lookups to locals, the loop can run many times
+        call_fn = self._call_fn
+        retryable_exceptions = self._retryable_exceptions
+        now_fn = NOW_FN
+
         sleep = sleep_base
-        now = NOW_FN()
+        now = now_fn()
         start_time = now
         start_time_triggered = None
 
@@ -128,21 +133,21 @@ class Retry(Generic[_R]):
 
         while True:
             try:
-                result = self._call_fn(*args, **kwargs)
+                result = call_fn(*args, **kwargs)
                 # Only print resolved attempts once every minute
                 if self._num_iter > 2 and now - self._last_print > datetime.timedelta(
                     minutes=1
                 ):
-                    self._last_print = NOW_FN()
+                    self._last_print = now_fn()
                     if self.retry_callback:
                         self.retry_callback(
                             200,
                             "{} resolved after {}, resuming normal operation.".format(
-                                self._error_prefix, NOW_FN() - start_time
+                                self._error_prefix, now_fn() - start_time
                             ),
                         )
                 return result
-            except self._retryable_exceptions as e:
+            except retryable_exceptions as e:
                 # if the secondary check fails, re-raise
                 retry_timedelta_triggered = check_retry_fn(e)
                 if not retry_timedelta_triggered:
@@ -152,7 +157,7 @@ class Retry(Generic[_R]):
                 if self._num_iter >= num_retries:
                     raise
 
-                now = NOW_FN()
+                now = now_fn()
 
                 # handle a triggered secondary check which could have a shortened timeout
                 if isinstance(retry_timedelta_triggered, datetime.timedelta):
@@ -168,6 +173,16 @@ class Retry(Generic[_R]):
                 if now - start_time >= retry_timedelta:
                     raise
 
+                # never sleep past a timeout, make the final attempt at the deadline instead
+                remaining = start_time + retry_timedelta - now
+                if start_time_triggered and isinstance(
+                    retry_timedelta_triggered, datetime.timedelta
+                ):
+                    remaining = min(
+                        remaining,
+                        start_time_triggered + retry_timedelta_triggered - now,
+                    )
+
                 if self._num_iter == 2:
                     logger.info("Retry attempt failed:", exc_info=e)
                     if (
@@ -188,14 +203,18 @@ class Retry(Generic[_R]):
                 # if wandb.env.is_debug():
                 #     traceback.print_exc()
             cancelled = self._sleep_check_cancelled(
-                sleep + random.random() * 0.25 * sleep, cancel_event=retry_cancel_event
+                min(
+                    sleep + random.random() * 0.25 * sleep,
+                    remaining.total_seconds(),
+                ),
+                cancel_event=retry_cancel_event,
             )
             if cancelled:
                 raise ContextCancelledError("retry timeout")
             sleep *= 2
             if sleep > self.MAX_SLEEP_SECONDS:
                 sleep = self.MAX_SLEEP_SECONDS
-            now = NOW_FN()
+            now = now_fn()
 
             self._num_iter += 1
 
@@ -225,7 +244,12 @@ class Backoff(abc.ABC):
 
 
 class ExponentialBackoff(Backoff):
-    """Jittered exponential backoff: sleep times increase ~exponentially up to some limit."""
+    """Jittered exponential backoff: sleep times increase ~exponentially up to some limit.
+
+    Uses "decorrelated jitter": each sleep, including the first, is drawn uniformly
+    between the initial sleep and 3x the previous one (the first draw takes the
+    initial sleep as "previous"), so concurrent retriers don't synchronize.
+    """
 
     def __init__(
         self,
@@ -233,11 +257,14 @@ class ExponentialBackoff(Backoff):
         max_sleep: datetime.timedelta,
         max_retries: Optional[int] = None,
         timeout_at: Optional[datetime.datetime] = None,
+        seed: Optional[int] = None,
     ) -> None:
-        self._next_sleep = min(max_sleep, initial_sleep)
+        self._initial_sleep = min(max_sleep, initial_sleep)
+        self._prev_sleep = self._initial_sleep
         self._max_sleep = max_sleep
         self._remaining_retries = max_retries
         self._timeout_at = timeout_at
+        self._rng = random.Random(seed)
 
     def next_sleep_or_reraise(self, exc: Exception) -> datetime.timedelta:
         if self._remaining_retries is not None:
@@ -245,13 +272,23 @@ class ExponentialBackoff(Backoff):
                 raise exc
             self._remaining_retries -= 1
 
-        if self._timeout_at is not None and NOW_FN() > self._timeout_at:
-            raise exc
-
-        result, self._next_sleep = self._next_sleep, min(
-            self._max_sleep, self._next_sleep * (1 + random.random())
+        result = self._prev_sleep = min(
+            self._max_sleep,
+            datetime.timedelta(
+                seconds=self._rng.uniform(
+                    self._initial_sleep.total_seconds(),
+                    3 * self._prev_sleep.total_seconds(),
+                )
+            ),
         )
 
+        if self._timeout_at is not None:
+            # never sleep past the timeout, the final attempt happens at the deadline
+            remaining = self._timeout_at - NOW_FN()
+            if remaining <= datetime.timedelta(0):
+                raise exc
+            result = min(result, remaining)
+
         return result
 
 
@@ -268,16 +305,32 @@ class FilteredBackoff(Backoff):
         return self._wrapped.next_sleep_or_reraise(exc)
 
 
+async def _sleep_async_check_cancelled(
+    wait_seconds: float, cancel_event: Optional[asyncio.Event]
+) -> bool:
+    if not cancel_event:
+        await SLEEP_ASYNC_FN(wait_seconds)
+        return False
+    try:
+        await asyncio.wait_for(cancel_event.wait(), timeout=wait_seconds)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
 async def retry_async(
     backoff: Backoff,
     fn: Callable[..., Awaitable[_R]],
     *args: Any,
     on_exc: Optional[Callable[[Exception], None]] = None,
+    cancel_event: Optional[asyncio.Event] = None,
     **kwargs: Any,
 ) -> _R:
     """Call `fn` repeatedly until either it succeeds, or `backoff` decides we should give up.
 
     Each time `fn` fails, `on_exc` is called with the exception.
+    If `cancel_event` is set while sleeping between attempts, stop retrying
+    immediately and raise `ContextCancelledError`.
     """
     while True:
         try:
@@ -285,4 +338,9 @@ async def retry_async(
         except Exception as e:
             if on_exc is not None:
                 on_exc(e)
-            await SLEEP_ASYNC_FN(backoff.next_sleep_or_reraise(e).total_seconds())
+            cancelled = await _sleep_async_check_cancelled(
+                backoff.next_sleep_or_reraise(e).total_seconds(),
+                cancel_event=cancel_event,
+            )
+            if cancelled:
+                raise ContextCancelledError("retry cancelled")
@@ -140,6 +140,18 @@ EXIT_TIMEOUT = 60
 RE_LABEL = re.compile(r"[a-zA-Z0-9_-]+$")
 
 
+@functools.lru_cache(maxsize=1)
+def _installed_packages_list() -> List[str]:
+    """Sorted requirements of the packages in the working set.
+
+    pkg_resources builds the working set once on import, so this is
+    effectively fixed for the lifetime of the process.
+    """
+    import pkg_resources
+
+    return sorted(f"{d.key}=={d.version}" for d in iter(pkg_resources.working_set))
+
+
 class TeardownStage(IntEnum):
     EARLY = 1
     LATE = 2
@@ -2260,11 +2272,7 @@ class Run:
                 os.remove(self._settings.resume_fname)
 
     def _make_job_source_reqs(self) -> Tuple[List[str], Dict[str, Any], Dict[str, Any]]:
-        import pkg_resources
-
-        installed_packages_list = sorted(
-            f"{d.key}=={d.version}" for d in iter(pkg_resources.working_set)
-        )
+        installed_packages_list = _installed_packages_list()
         input_types = TypeRegistry.type_of(self.config.as_dict()).to_json()
         output_types = TypeRegistry.type_of(self.summary._as_dict()).to_json()
 
@@ -53,7 +53,7 @@ import wandb.env
 from wandb.errors import AuthenticationError, CommError, UsageError, term
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
 from wandb.sdk.lib import filesystem, runid
-from wandb.sdk.lib.json_util import dump, dumps
+from wandb.sdk.lib.json_util import dump, dumps, load
 from wandb.sdk.lib.paths import FilePathStr, StrPath
 
 if TYPE_CHECKING:
@@ -1560,7 +1560,7 @@ def load_json_yaml_dict(config: str) -> Any:
     ext = os.path.splitext(config)[-1]
     if ext == ".json":
         with open(config) as f:
-            return json.load(f)
+            return load(f)
     elif ext == ".yaml":
         with open(config) as f:
             return yaml.safe_load(f)